@@ -9,3 +9,8 @@ class AppConfig(DjangoAppConfig):
     include_in_administration_section = True
     has_exportable_data = True
     default_auto_field = "django.db.models.BigAutoField"
+
+    def ready(self):
+        from .utils import populate_registries
+
+        populate_registries()
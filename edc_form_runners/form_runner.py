@@ -2,14 +2,26 @@ from __future__ import annotations
 
 import html
 import uuid
+from functools import cached_property, reduce
+from html.parser import HTMLParser
+from operator import or_
 from typing import TYPE_CHECKING, Any
 
-from bs4 import BeautifulSoup
 from django.apps import apps as django_apps
-from django.db.models import ForeignKey, ManyToManyField, Model, OneToOneField, QuerySet
+from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
+from django.db import transaction
+from django.db.models import (
+    ForeignKey,
+    ManyToManyField,
+    Model,
+    OneToOneField,
+    Q,
+    QuerySet,
+    TextField,
+)
 from django.forms import ModelForm
+from django.forms.models import model_to_dict
 from edc_utils import get_utcnow
-from tqdm import tqdm
 
 from .exceptions import FormRunnerModelAdminNotFound, FormRunnerModelFormNotFound
 from .utils import get_modeladmin_cls
@@ -19,25 +31,66 @@ if TYPE_CHECKING:
 
 __all__ = ["FormRunner"]
 
+# optional attrs of the related visit (or source instance) in `unique_opts`
+VISIT_ATTRS = ("visit_code", "visit_code_sequence", "visit_schedule_name", "schedule_name")
+
+
+class HtmlTextParser(HTMLParser):
+    """Collects the text content of an HTML fragment, as
+    BeautifulSoup(value, "html.parser").text does.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.text_parts: list[str] = []
+
+    def handle_data(self, data: str) -> None:
+        self.text_parts.append(data)
+
+
+def strip_html_tags(value: str) -> str:
+    parser = HtmlTextParser()
+    parser.feed(value)
+    parser.close()
+    return "".join(parser.text_parts)
+
 
 class FormRunner:
-    """Rerun modelform validation on all instances of a model"""
+    """Rerun modelform validation on all instances of a model
+
+    If `fast_candidate` is True, `run_all` only validates instances
+    where a required form field is null or empty in the DB (see
+    `candidate_qs`). This skips instances that would only fail
+    custom `clean` / form validator logic, so leave it off for
+    forms with cross-field validation. Existing issues for all
+    instances in the source filter are deleted first so that
+    instances that are no longer candidates do not keep stale issues.
+    """
 
     model_name: str | None = None
     issue_model = "edc_form_runners.issue"
     extra_formfields: list[str] | None = None
     exclude_formfields: list[str] | None = None
+    batch_size: int = 500
+    chunk_size: int = 2000
+    fast_candidate: bool = False
 
     def __init__(
         self,
         model_name: str | None = None,
         src_filter_options: dict[str, Any] | None = None,
         verbose: bool | None = None,
+        fast_candidate: bool | None = None,
     ) -> None:
         self.messages = {}
+        self._pending_issues: dict[tuple, list[Issue]] = {}
+        self._form: ModelForm | None = None
+        self._form_state: dict[str, Any] = {}
         self.session_id = uuid.uuid4()
         self.session_datetime = get_utcnow()
         self.verbose = verbose
+        if fast_candidate is not None:
+            self.fast_candidate = fast_candidate
         self.model_name = self.model_name or model_name
         self.modeladmin_cls = get_modeladmin_cls(self.model_name)
         if not self.modeladmin_cls:
@@ -51,6 +104,8 @@ class FormRunner:
                 f"Got `{model_name}`."
             )
         self.src_model_cls = self.modeladmin_cls.model
+        self.label_lower = self.src_model_cls._meta.label_lower
+        self.verbose_name = self.src_model_cls._meta.verbose_name
 
         # note: modeladmin_cls must declare a custom ModelForm
         self.modelform_cls = self.modeladmin_cls.form
@@ -64,34 +119,116 @@ class FormRunner:
         return self.model_name
 
     def run_all(self) -> None:
-        total = self.src_qs.count()
-        for src_obj in tqdm(self.src_qs, total=total):
-            self.issue_model_cls.objects.filter(**self.unique_opts(src_obj)).delete()
-            self.run_one(src_obj=src_obj, skip_delete=True)
+        from tqdm import tqdm
+
+        if self.fast_candidate:
+            src_ids = self.src_model_cls.objects.filter(
+                **(self.get_src_filter_options() or {})
+            ).values("id")
+            self.issue_model_cls.objects.filter(
+                label_lower=self.label_lower, src_id__in=src_ids
+            ).delete()
+            src_qs = self.candidate_qs
+        else:
+            src_qs = self.src_qs
+        total = src_qs.count() if self.verbose else None
+        for src_obj in tqdm(src_qs.iterator(chunk_size=self.chunk_size), total=total):
+            # replaces any pending issues for the same unique_opts
+            # (see `run_one` which deletes before writing)
+            opts = self.unique_opts(src_obj)
+            self._pending_issues.update(
+                {tuple(opts.items()): self.validate(src_obj, opts=opts)}
+            )
+            if len(self._pending_issues) >= self.batch_size:
+                self.flush()
+        self.flush()
         for k, v in self.messages.items():
             print(f"Warning: {k}: {v}")
 
     def run_one(self, src_obj: Model, skip_delete: bool | None = None) -> None:
-        if not skip_delete:
-            self.issue_model_cls.objects.filter(**self.unique_opts(src_obj)).delete()
+        opts = self.unique_opts(src_obj)
+        with transaction.atomic():
+            if not skip_delete:
+                self.issue_model_cls.objects.filter(**opts).delete()
+            issue_objs = self.validate(src_obj, opts=opts, commit=True)
+        for issue_obj in issue_objs:
+            self.print(str(issue_obj))
+
+    def validate(
+        self,
+        src_obj: Model,
+        opts: dict[str, Any] | None = None,
+        commit: bool | None = False,
+    ) -> list[Issue]:
+        """Returns a list of Issue model instances, one per form error
+        on a field in the ModelAdmin fieldsets.
+
+        Instances are not saved unless `commit` is True.
+        """
         data = self.get_form_data(src_obj)
-        form = self.modelform_cls(data, instance=src_obj)
-        form.is_valid()
-        errors = {
-            k: v for k, v in form._errors.items() if k not in self.get_exclude_formfields()
-        }
-        if errors:
-            for fldname, errmsg in errors.items():
-                if fldname in self.fieldset_fields:
-                    issue_obj = self.write_to_db(fldname, errmsg, src_obj)
-                    if self.verbose:
-                        self.print(str(issue_obj))
+        form = self.get_form(data, src_obj)
+        if form.is_valid():
+            return []
+        opts = self.unique_opts(src_obj) if opts is None else opts
+        return [
+            self.write_to_db(fldname, errmsg, src_obj, opts=opts, commit=commit)
+            for fldname, errmsg in form._errors.items()
+            if fldname in self.reportable_fields
+        ]
+
+    def get_form(self, data: dict[str, Any], src_obj: Model) -> ModelForm:
+        """Returns a bound ModelForm instance for `src_obj`.
+
+        If the ModelForm class does not override `__init__`, a single
+        form instance is rebound to each `src_obj` instead of
+        constructing a new form per row. The form's attributes are
+        restored to a snapshot taken after `__init__` before rebinding
+        so that nothing set during a previous validation is reused.
+        Field instances in `form.fields` are not copied.
+        """
+        if self.modelform_cls.__init__ is not ModelForm.__init__ or self._form is None:
+            self._form = self.modelform_cls(data, instance=src_obj)
+            self._form_state = dict(self._form.__dict__)
+        else:
+            self._form.__dict__.clear()
+            self._form.__dict__.update(self._form_state)
+            self._form.data = data
+            self._form.files = {}
+            self._form.is_bound = True
+            self._form.instance = src_obj
+            self._form.initial = model_to_dict(
+                src_obj, self._form._meta.fields, self._form._meta.exclude
+            )
+            self._form._errors = None
+            self._form._bound_fields_cache = {}
+        return self._form
+
+    def flush(self) -> None:
+        """Deletes existing and bulk creates pending Issue model
+        instances.
+
+        The delete and insert for a batch run in one transaction. If a
+        batch fails, only that batch is rolled back; batches flushed
+        earlier in `run_all` are kept.
+        """
+        if self._pending_issues:
+            issue_objs = [obj for objs in self._pending_issues.values() for obj in objs]
+            with transaction.atomic():
+                self.issue_model_cls.objects.filter(
+                    reduce(or_, [Q(**dict(k)) for k in self._pending_issues])
+                ).delete()
+                self.issue_model_cls.objects.bulk_create(
+                    issue_objs, batch_size=self.batch_size
+                )
+            for issue_obj in issue_objs:
+                self.print(str(issue_obj))
+            self._pending_issues = {}
 
     @property
     def issue_model_cls(self) -> Issue:
         return django_apps.get_model(self.issue_model)
 
-    @property
+    @cached_property
     def fieldset_fields(self) -> list[str]:
         fields = []
         if self.modeladmin_cls.form != ModelForm:
@@ -114,14 +251,26 @@ class FormRunner:
         fields = list(set(fields))
         return fields
 
-    def write_to_db(self, fldname: str, errmsg: Any, src_obj: Any) -> Issue:
-        raw_message = html.unescape(errmsg.as_text())
-        message = BeautifulSoup(raw_message, "html.parser").text
+    def write_to_db(
+        self,
+        fldname: str,
+        errmsg: Any,
+        src_obj: Any,
+        opts: dict[str, Any] | None = None,
+        commit: bool | None = True,
+    ) -> Issue:
+        raw_message = errmsg.as_text()
+        if "&" in raw_message:
+            raw_message = html.unescape(raw_message)
+        if "<" in raw_message or "&" in raw_message:
+            message = strip_html_tags(raw_message)
+        else:
+            message = raw_message
         try:
             response = getattr(src_obj, fldname)
         except AttributeError:
             response = None
-        return self.issue_model_cls.objects.create(
+        issue_obj = self.issue_model_cls(
             session_id=self.session_id,
             session_datetime=self.session_datetime,
             raw_message=raw_message,
@@ -139,8 +288,11 @@ class FormRunner:
             site=src_obj.site,
             extra_formfields=",".join(self.get_extra_formfields()),
             exclude_formfields=",".join(self.get_exclude_formfields()),
-            **self.unique_opts(src_obj),
+            **(self.unique_opts(src_obj) if opts is None else opts),
         )
+        if commit:
+            issue_obj.save()
+        return issue_obj
 
     def unique_opts(self, src_obj: Model) -> dict[str, Any]:
         """Note: unique constraint includes `field_name`"""
@@ -149,25 +301,19 @@ class FormRunner:
         if (
             get_related_visit_model_attr
             and get_related_visit_model_attr()
-            and src_obj.related_visit
+            and (related_visit := src_obj.related_visit)
         ):
-            model_obj_or_related_visit = src_obj.related_visit
-        subject_identifier = model_obj_or_related_visit.subject_identifier
-        opts = dict(
-            label_lower=src_obj._meta.label_lower,
-            panel_name=self.get_panel_name(src_obj),
-            verbose_name=src_obj._meta.verbose_name,
-            subject_identifier=subject_identifier,
-        )
-        for fldname in [
-            "visit_code",
-            "visit_code_sequence",
-            "visit_schedule_name",
-            "schedule_name",
-        ]:
+            model_obj_or_related_visit = related_visit
+        opts = {
+            "label_lower": self.label_lower,
+            "panel_name": self.get_panel_name(src_obj),
+            "verbose_name": self.verbose_name,
+            "subject_identifier": model_obj_or_related_visit.subject_identifier,
+        }
+        for fldname in VISIT_ATTRS:
             value = getattr(model_obj_or_related_visit, fldname, None)
             if value is not None:
-                opts.update({fldname: value})
+                opts[fldname] = value
         return opts
 
     @staticmethod
@@ -175,29 +321,119 @@ class FormRunner:
         panel = getattr(src_obj, "panel", None)
         return getattr(panel, "name", None)
 
+    @cached_property
+    def field_partition(self) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """Returns a tuple of the FK/OneToOne field names and the M2M
+        field names of the source model.
+        """
+        fk_names = []
+        m2m_names = []
+        for fld_cls in self.src_model_cls._meta.get_fields():
+            if isinstance(fld_cls, (ForeignKey, OneToOneField)):
+                fk_names.append(fld_cls.name)
+            elif isinstance(fld_cls, (ManyToManyField,)):
+                m2m_names.append(fld_cls.name)
+        return tuple(fk_names), tuple(m2m_names)
+
+    @cached_property
+    def plain_attnames(self) -> tuple[str, ...]:
+        """Returns the attnames of the source model's concrete,
+        non-relational fields.
+        """
+        return tuple(
+            fld_cls.attname
+            for fld_cls in self.src_model_cls._meta.concrete_fields
+            if not fld_cls.is_relation
+            and not fld_cls.attname.startswith("_")
+            and not fld_cls.attname.endswith("_id")
+        )
+
+    @cached_property
+    def exclude_formfields_set(self) -> frozenset[str]:
+        return frozenset(self.get_exclude_formfields())
+
+    @cached_property
+    def reportable_fields(self) -> frozenset[str]:
+        """Returns the names of fields in the ModelAdmin fieldsets
+        that are not excluded.
+        """
+        return frozenset(self.fieldset_fields) - self.exclude_formfields_set
+
+    @cached_property
+    def deferred_fields(self) -> tuple[str, ...]:
+        """Returns the names of TextFields on the source model that
+        are not used by the form.
+        """
+        used = (
+            set(self.modelform_cls.base_fields)
+            | set(self.fieldset_fields)
+            | set(self.get_extra_formfields())
+        )
+        return tuple(
+            fld_cls.name
+            for fld_cls in self.src_model_cls._meta.concrete_fields
+            if isinstance(fld_cls, TextField) and fld_cls.name not in used
+        )
+
     @property
     def src_qs(self) -> QuerySet:
-        return self.src_model_cls.objects.filter(**(self.get_src_filter_options() or {}))
+        """Returns the source queryset with forward relations joined
+        or prefetched to avoid a query per row in `get_form_data`.
+
+        TextFields not used by the form are deferred.
+        """
+        fk_names, m2m_names = self.field_partition
+        return (
+            self.src_model_cls.objects.filter(**(self.get_src_filter_options() or {}))
+            .select_related(*fk_names)
+            .prefetch_related(*m2m_names)
+            .defer(*self.deferred_fields)
+        )
+
+    @property
+    def candidate_qs(self) -> QuerySet:
+        """Returns the source queryset filtered on rows where any
+        required form field in the fieldsets is null or an empty
+        string.
+
+        Returns the unfiltered source queryset if there are no such
+        form fields.
+        """
+        q_objects = []
+        for name, form_fld_cls in self.modelform_cls.base_fields.items():
+            if (
+                not form_fld_cls.required
+                or name not in self.fieldset_fields
+                or name in self.exclude_formfields_set
+            ):
+                continue
+            try:
+                fld_cls = self.src_model_cls._meta.get_field(name)
+            except FieldDoesNotExist:
+                continue
+            if fld_cls.many_to_many or not fld_cls.concrete:
+                continue
+            if fld_cls.null:
+                q_objects.append(Q(**{f"{name}__isnull": True}))
+            if fld_cls.empty_strings_allowed and not fld_cls.is_relation:
+                q_objects.append(Q(**{name: ""}))
+        if not q_objects:
+            return self.src_qs
+        return self.src_qs.filter(reduce(or_, q_objects))
 
     def get_form_data(self, src_obj: Any) -> dict[str, Any]:
-        data = {
-            k: v
-            for k, v in src_obj.__dict__.items()
-            if not k.startswith("_") and not k.endswith("_id")
-        }
-        for fld_cls in src_obj._meta.get_fields():
-            if isinstance(fld_cls, (ForeignKey, OneToOneField)):
-                try:
-                    obj_fld_id = getattr(src_obj, fld_cls.name).id
-                except AttributeError:
-                    rel_obj = None
-                else:
-                    rel_obj = fld_cls.related_model.objects.get(id=obj_fld_id)
-                data.update({fld_cls.name: rel_obj})
-            elif isinstance(fld_cls, (ManyToManyField,)):
-                data.update({fld_cls.name: getattr(src_obj, fld_cls.name).all()})
-            else:
-                pass
+        values = src_obj.__dict__
+        data = {k: values[k] for k in self.plain_attnames if k in values}
+        fk_names, m2m_names = self.field_partition
+        for name in fk_names:
+            try:
+                rel_obj = getattr(src_obj, name)
+            except ObjectDoesNotExist:
+                rel_obj = None
+            data.update({name: rel_obj})
+        for name in m2m_names:
+            # prefetched in `src_qs`, pass pks to the form field
+            data.update({name: [obj.pk for obj in getattr(src_obj, name).all()]})
         try:
             data.update(subject_visit=src_obj.subject_visit)
         except AttributeError:
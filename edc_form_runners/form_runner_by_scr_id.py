@@ -25,7 +25,7 @@ class BaseFormRunnerBySrcId:
         raise NotImplementedError
 
     def run_one(self) -> None:
-        src_obj = self.src_model_cls.objects.get(id=self.src_id)
+        src_obj = self.src_qs.get(id=self.src_id)
         super().run_one(src_obj)
 
 
@@ -33,6 +33,15 @@ class Command(BaseCommand):
             help="model to skip in label_lower format, if more than one separate by comma",
         )
 
+        parser.add_argument(
+            "-w",
+            "--max-workers",
+            dest="max_workers",
+            type=int,
+            default=None,
+            help="number of worker processes to run models in parallel (default: 1)",
+        )
+
         parser.add_argument(
             "--debug",
             dest="debug",
@@ -74,7 +83,7 @@ class Command(BaseCommand):
         model_names = [m for m in model_names if m not in skip_model_names]
 
         try:
-            run_form_runners(model_names=model_names)
+            run_form_runners(model_names=model_names, max_workers=options["max_workers"])
         except FormRunnerError as e:
             if debug:
                 raise
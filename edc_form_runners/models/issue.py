@@ -41,6 +41,8 @@ class Issue(BaseUuidModel):
     class Meta(BaseUuidModel.Meta):
         verbose_name = "Issue"
         verbose_name_plural = "Issues"
+        # the index backing this constraint also serves the equality
+        # lookups in `get_form_runner_issues` and `FormRunner.flush`
         constraints = [
             UniqueConstraint(
                 fields=[
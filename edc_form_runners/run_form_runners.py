@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
 from django.apps import apps as django_apps
+from django.db import connections
 
 from .exceptions import (
     FormRunnerError,
@@ -9,15 +13,21 @@ from .exceptions import (
     FormRunnerModelFormNotFound,
 )
 from .get_form_runner import get_form_runner
+from .utils import get_issue_model_cls
 
-__all__ = ["run_form_runners"]
-
-from .models import Issue
+__all__ = ["run_form_runner", "run_form_runners"]
 
 
 def run_form_runners(
-    app_labels: list[str] | None = None, model_names: list[str] | None = None
+    app_labels: list[str] | None = None,
+    model_names: list[str] | None = None,
+    max_workers: int | None = None,
 ):
+    """Runs the form runner for each model.
+
+    If `max_workers` is greater than 1, models are run in parallel
+    in forked worker processes, each with its own DB connection.
+    """
     model_names = model_names or []
     if app_labels:
         for app_config in django_apps.get_app_configs():
@@ -27,16 +37,35 @@ def run_form_runners(
                         model_names.append(model_cls._meta.label_lower)
     if not model_names:
         raise FormRunnerError("Nothing to do.")
-    for model_name in model_names:
-        print(model_name)
-        Issue.objects.filter(label_lower=model_name).delete()
-        try:
-            get_form_runner(model_name, verbose=True).run_all()
-        except (
-            FormRunnerImproperlyConfigured,
-            FormRunnerModelAdminNotFound,
-            FormRunnerModelFormNotFound,
-        ) as e:
-            print(f"{e} See {model_name}.")
-        except AttributeError as e:
-            print(f"{e} See {model_name}.")
+    if max_workers and max_workers > 1:
+        # do not share the parent's DB connections with forked workers
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=get_context("fork")
+        ) as executor:
+            list(executor.map(_run_form_runner_in_worker, model_names))
+    else:
+        for model_name in model_names:
+            run_form_runner(model_name)
+
+
+def run_form_runner(model_name: str) -> None:
+    print(model_name)
+    get_issue_model_cls().objects.filter(label_lower=model_name).delete()
+    try:
+        get_form_runner(model_name, verbose=True).run_all()
+    except (
+        FormRunnerImproperlyConfigured,
+        FormRunnerModelAdminNotFound,
+        FormRunnerModelFormNotFound,
+    ) as e:
+        print(f"{e} See {model_name}.")
+    except AttributeError as e:
+        print(f"{e} See {model_name}.")
+
+
+def _run_form_runner_in_worker(model_name: str) -> None:
+    try:
+        run_form_runner(model_name)
+    finally:
+        connections.close_all()
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 
 from django import template
 
-from edc_form_runners.utils import get_form_runner_issues
+from edc_form_runners.utils import get_form_runner_issues, get_form_runner_issues_key
 
 if TYPE_CHECKING:
     from django.db import models
@@ -18,14 +18,32 @@ register = template.Library()
 
 
 @register.inclusion_tag("edc_form_runners/form_runner_issues.html")
-def show_form_runner_issues(metadata_model_obj: CrfMetadata | RequisitionMetadata):
+def show_form_runner_issues(
+    metadata_model_obj: CrfMetadata | RequisitionMetadata,
+    form_runner_issues: dict[tuple, list[tuple[str, str]]] | None = None,
+):
+    """Renders issues for the model instance of a metadata model
+    instance.
+
+    If the view has fetched issues for the page using
+    `bulk_get_form_runner_issues`, pass the dictionary as
+    `form_runner_issues` to avoid a query per CRF.
+    """
     messages = []
     if metadata_model_obj and metadata_model_obj.model_instance:
         model_obj = metadata_model_obj.model_instance
         related_visit = getattr(model_obj, model_obj.related_visit_model_attr())
         panel_name = getattr(metadata_model_obj, "panel_name", None)
-        qs = get_form_runner_issues(
-            model_obj._meta.label_lower, related_visit, panel_name=panel_name
-        )
-        messages = [f"{issue.message} [{issue.field_name}]" for issue in qs]
+        if form_runner_issues is not None:
+            rows = form_runner_issues.get(
+                get_form_runner_issues_key(
+                    model_obj._meta.label_lower, related_visit, panel_name=panel_name
+                ),
+                [],
+            )
+        else:
+            rows = get_form_runner_issues(
+                model_obj._meta.label_lower, related_visit, panel_name=panel_name
+            ).values_list("message", "field_name")
+        messages = [f"{message} [{field_name}]" for message, field_name in rows]
     return dict(form_runner_issues="<BR>".join(messages))
@@ -4,6 +4,7 @@ from zoneinfo import ZoneInfo
 
 import time_machine
 from django.core.exceptions import ObjectDoesNotExist
+from django.forms.utils import ErrorList
 from django.test import TestCase, override_settings
 from edc_appointment.models import Appointment
 from edc_appointment.tests.helper import Helper
@@ -16,7 +17,18 @@ from edc_visit_tracking.models import SubjectVisit
 from edc_form_runners.exceptions import FormRunnerModelFormNotFound
 from edc_form_runners.form_runner import FormRunner
 from edc_form_runners.models import Issue
+from edc_form_runners.utils import (
+    bulk_get_form_runner_issues,
+    get_form_runner_issues,
+    get_form_runner_issues_key,
+    get_modeladmin_cls,
+    get_modeladmins_from_admin_sites,
+    get_modelform_cls,
+    reset_caches,
+)
+from form_runners_app.admin import TeamAdmin
 from form_runners_app.consents import consent_v1
+from form_runners_app.forms import TeamForm
 from form_runners_app.models import Member, Team, TeamWithDifferentFields, Venue
 from form_runners_app.visit_schedules import visit_schedule
 
@@ -50,6 +62,34 @@ class TestRunners(TestCase):
             visit_schedule_name="visit_schedule", schedule_name="schedule"
         )
 
+    def get_subject_visits(self, *subject_identifiers: str) -> list[SubjectVisit]:
+        """Returns a subject visit at the first appointment for each
+        subject, consenting and putting on schedule any subject other
+        than `self.subject_identifier`.
+        """
+        subject_visits = []
+        for subject_identifier in subject_identifiers:
+            if subject_identifier != self.subject_identifier:
+                self.helper_cls(
+                    subject_identifier=subject_identifier
+                ).consent_and_put_on_schedule(
+                    visit_schedule_name=self.visit_schedule_name,
+                    schedule_name=self.schedule_name,
+                )
+            appointment = (
+                Appointment.objects.filter(subject_identifier=subject_identifier)
+                .order_by("timepoint_datetime")
+                .first()
+            )
+            subject_visits.append(
+                SubjectVisit.objects.create(
+                    appointment=appointment,
+                    subject_identifier=subject_identifier,
+                    reason=SCHEDULED,
+                )
+            )
+        return subject_visits
+
     def test_appointment(self):
         form_runner = FormRunner(model_name="edc_appointment.appointment")
         form_runner.run_all()
@@ -126,3 +166,182 @@ class TestRunners(TestCase):
             )
         except ObjectDoesNotExist:
             self.fail("Issue model instance unexpectedly does not exist")
+
+    def test_bulk_get_form_runner_issues(self):
+        subject_visits = []
+        for appointment in Appointment.objects.all().order_by("timepoint_datetime"):
+            subject_visit = SubjectVisit.objects.create(
+                appointment=appointment,
+                subject_identifier=self.subject_identifier,
+                reason=SCHEDULED,
+            )
+            subject_visits.append(subject_visit)
+            Team.objects.create(subject_visit=subject_visit, name=uuid4())
+        FormRunner(model_name="form_runners_app.team").run_all()
+
+        with self.assertNumQueries(1):
+            form_runner_issues = bulk_get_form_runner_issues(
+                ["form_runners_app.team"], subject_visits
+            )
+        for subject_visit in subject_visits:
+            self.assertEqual(
+                form_runner_issues.get(
+                    get_form_runner_issues_key("form_runners_app.team", subject_visit),
+                    [],
+                ),
+                list(
+                    get_form_runner_issues("form_runners_app.team", subject_visit).values_list(
+                        "message", "field_name"
+                    )
+                ),
+            )
+
+    def test_fast_candidate(self):
+        subject_visit, other_subject_visit = self.get_subject_visits("1235", "1236")
+        candidate = TeamWithDifferentFields.objects.create(
+            subject_visit=subject_visit, size=11, color=None
+        )
+        not_candidate = TeamWithDifferentFields.objects.create(
+            subject_visit=other_subject_visit, size=11, color=None
+        )
+        FormRunner(model_name="form_runners_app.teamwithdifferentfields").run_all()
+        self.assertTrue(Issue.objects.filter(src_id=not_candidate.id).exists())
+
+        # fix without the post_save signal, the stale issue must go
+        TeamWithDifferentFields.objects.filter(id=not_candidate.id).update(color="blue")
+
+        form_runner = FormRunner(
+            model_name="form_runners_app.teamwithdifferentfields", fast_candidate=True
+        )
+        self.assertEqual([obj.id for obj in form_runner.candidate_qs], [candidate.id])
+        form_runner.run_all()
+        try:
+            Issue.objects.get(
+                label_lower="form_runners_app.teamwithdifferentfields",
+                src_id=candidate.id,
+                field_name="color",
+            )
+        except ObjectDoesNotExist:
+            self.fail("Issue model instance unexpectedly does not exist")
+        self.assertFalse(Issue.objects.filter(src_id=not_candidate.id).exists())
+
+    def test_reused_form_valid_and_invalid_rows(self):
+        subject_visits = self.get_subject_visits("1235", "1236", "1237", "1238")
+        teams = [
+            Team.objects.create(
+                subject_visit=subject_visit,
+                name=uuid4() if index % 2 == 0 else "not-a-uuid",
+            )
+            for index, subject_visit in enumerate(subject_visits)
+        ]
+        invalid_teams = teams[0::2]
+        valid_teams = teams[1::2]
+
+        # validate alternating rows on one runner (one reused form)
+        form_runner = FormRunner(model_name="form_runners_app.team")
+        for _ in range(2):
+            for team in teams:
+                issue_objs = form_runner.validate(team)
+                if team in valid_teams:
+                    self.assertEqual(issue_objs, [])
+                else:
+                    self.assertEqual(
+                        [(obj.src_id, obj.field_name) for obj in issue_objs],
+                        [(team.id, "name")],
+                    )
+
+        FormRunner(model_name="form_runners_app.team").run_all()
+        self.assertEqual(
+            sorted(Issue.objects.values_list("src_id", flat=True)),
+            sorted(team.id for team in invalid_teams),
+        )
+        for team in invalid_teams:
+            self.assertEqual(
+                list(
+                    Issue.objects.filter(src_id=team.id).values_list("field_name", flat=True)
+                ),
+                ["name"],
+            )
+        self.assertFalse(
+            Issue.objects.filter(src_id__in=[team.id for team in valid_teams]).exists()
+        )
+
+    def test_registry_rebuilt_once_on_miss(self):
+        self.addCleanup(reset_caches)
+        # simulate a registry built before TeamAdmin was registered
+        reset_caches()
+        get_modeladmins_from_admin_sites().pop("form_runners_app.team")
+        self.assertIsInstance(get_modeladmin_cls("form_runners_app.team"), TeamAdmin)
+        self.assertEqual(get_modelform_cls("form_runners_app.team"), TeamForm)
+
+        # later misses are plain dict lookups, no rebuild
+        registry = get_modeladmins_from_admin_sites()
+        self.assertIsNone(get_modeladmin_cls("form_runners_app.doesnotexist"))
+        self.assertIs(get_modeladmins_from_admin_sites(), registry)
+        registry.pop("form_runners_app.team")
+        self.assertIsNone(get_modeladmin_cls("form_runners_app.team"))
+
+    def test_run_all_flushes_in_batches(self):
+        subject_visits = self.get_subject_visits("1235", "1236", "1237")
+        teams = [
+            Team.objects.create(subject_visit=obj, name=uuid4()) for obj in subject_visits
+        ]
+        for _ in range(3):
+            Member.objects.create(team=teams[0])
+
+        for _ in range(2):
+            form_runner = FormRunner(model_name="form_runners_app.team")
+            form_runner.batch_size = 2
+            form_runner.run_all()
+            # rerun replaces issues, does not duplicate them
+            self.assertEqual(
+                sorted(
+                    Issue.objects.filter(label_lower="form_runners_app.team").values_list(
+                        "src_id", "field_name", "session_id"
+                    )
+                ),
+                sorted((team.id, "name", form_runner.session_id) for team in teams),
+            )
+
+        # members share unique_opts, the last member flushed wins as
+        # it does within a single batch
+        form_runner = FormRunner(model_name="form_runners_app.member")
+        form_runner.batch_size = 1
+        form_runner.run_all()
+        self.assertEqual(
+            Issue.objects.filter(
+                label_lower="form_runners_app.member", field_name="player_name"
+            ).count(),
+            1,
+        )
+
+    def test_write_to_db_messages(self):
+        (subject_visit,) = self.get_subject_visits("1235")
+        team = Team.objects.create(subject_visit=subject_visit, name=uuid4())
+        form_runner = FormRunner(model_name="form_runners_app.team")
+        for errmsg, raw_message, message in [
+            # no "&" or "<", not parsed
+            (
+                "This field is required.",
+                "* This field is required.",
+                "* This field is required.",
+            ),
+            # comparison operators are kept
+            ("Expected x<=5; y>=3", "* Expected x<=5; y>=3", "* Expected x<=5; y>=3"),
+            (
+                "Value must be < 5 and > 2",
+                "* Value must be < 5 and > 2",
+                "* Value must be < 5 and > 2",
+            ),
+            ("Value is &lt; 5 or &gt; 2", "* Value is < 5 or > 2", "* Value is < 5 or > 2"),
+            # tags are stripped, remaining entities decoded
+            ("<b>Cannot</b> be a UUID", "* <b>Cannot</b> be a UUID", "* Cannot be a UUID"),
+            ("Tom &amp;amp; Jerry", "* Tom &amp; Jerry", "* Tom & Jerry"),
+        ]:
+            with self.subTest(errmsg=errmsg):
+                issue_obj = form_runner.write_to_db(
+                    "name", ErrorList([errmsg]), team, commit=False
+                )
+                self.assertEqual(issue_obj.raw_message, raw_message)
+                self.assertEqual(issue_obj.message, message)
+                self.assertEqual(issue_obj.short_message, message)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from functools import cache
 from typing import TYPE_CHECKING, Type
 
 from django.apps import apps as django_apps
@@ -23,14 +22,25 @@ if TYPE_CHECKING:
 
 
 __all__ = [
+    "bulk_get_form_runner_issues",
     "get_form_runner_issues",
+    "get_form_runner_issues_key",
     "get_edc_form_runners_enabled",
     "get_issue_model_cls",
-    # "get_modelforms_from_admin_sites",
+    "get_modelforms_from_admin_sites",
     "get_modeladmins_from_admin_sites",
     "get_modeladmin_cls",
+    "get_modelform_cls",
+    "populate_registries",
+    "rebuild_registries_on_miss",
+    "reset_caches",
 ]
 
+# built by `populate_registries`, None until first built
+_modeladmin_registry: dict[str, Type[ModelAdmin]] | None = None
+_modelform_registry: dict[str, Type[ModelForm]] | None = None
+_rebuilt_on_miss: bool = False
+
 
 def get_edc_form_runners_enabled() -> bool:
     return getattr(settings, "EDC_FORM_RUNNERS_ENABLED", False)
@@ -40,54 +50,146 @@ def get_issue_model_cls() -> Issue:
     return django_apps.get_model("edc_form_runners.issue")
 
 
-@cache
-def get_modeladmins_from_admin_sites() -> dict[str, Type[ModelAdmin]]:
-    registry = {}
+def populate_registries() -> None:
+    """Builds the ModelAdmin and ModelForm registries from all
+    admin sites.
+
+    Called from `AppConfig.ready`. If `ready` runs before all admin
+    modules are imported, the first lookup that misses rebuilds the
+    registries once (see `get_modeladmin_cls`).
+    """
+    global _modeladmin_registry, _modelform_registry
+    modeladmin_registry = {}
+    modelform_registry = {}
     for admin_site in admin.sites.all_sites:
-        registry.update(**get_modeladmins_from_admin_site(admin_site))
-    return registry
+        for admin_class in admin_site._registry.values():
+            label_lower = admin_class.model._meta.label_lower
+            modeladmin_registry.update({label_lower: admin_class})
+            modelform_registry.update({label_lower: admin_class.form})
+    _modeladmin_registry, _modelform_registry = modeladmin_registry, modelform_registry
+
 
+def rebuild_registries_on_miss() -> bool:
+    """Rebuilds the registries on the first lookup miss only and
+    returns True if rebuilt.
 
-@cache
-def get_modelforms_from_admin_site(admin_site) -> dict[str, Type[ModelForm]]:
-    registry = {}
-    for admin_class in admin_site._registry.values():
-        registry.update({admin_class.model._meta.label_lower: admin_class.form})
-    return registry
+    Models without a ModelAdmin miss on every lookup. Rebuilding
+    once is enough to pick up ModelAdmins imported after `ready`.
+    """
+    global _rebuilt_on_miss
+    if _rebuilt_on_miss:
+        return False
+    _rebuilt_on_miss = True
+    populate_registries()
+    return True
 
 
-@cache
-def get_modeladmins_from_admin_site(admin_site) -> dict[str, Type[ModelAdmin]]:
-    registry = {}
-    for admin_class in admin_site._registry.values():
-        registry.update({admin_class.model._meta.label_lower: admin_class})
-    return registry
+def get_modeladmins_from_admin_sites() -> dict[str, Type[ModelAdmin]]:
+    """Returns a dictionary of ModelAdmin classes registered with
+    any admin site keyed by label_lower.
+    """
+    if _modeladmin_registry is None:
+        populate_registries()
+    return _modeladmin_registry
+
+
+def get_modelforms_from_admin_sites() -> dict[str, Type[ModelForm]]:
+    """Returns a dictionary of ModelForm classes declared on any
+    registered ModelAdmin keyed by label_lower.
+    """
+    if _modelform_registry is None:
+        populate_registries()
+    return _modelform_registry
 
 
 def get_modeladmin_cls(model_name: str) -> Type[ModelAdmin]:
-    return get_modeladmins_from_admin_sites().get(model_name)
+    registry = get_modeladmins_from_admin_sites()
+    if model_name not in registry and rebuild_registries_on_miss():
+        registry = get_modeladmins_from_admin_sites()
+    return registry.get(model_name)
+
+
+def get_modelform_cls(model_name: str) -> Type[ModelForm]:
+    registry = get_modelforms_from_admin_sites()
+    if model_name not in registry and rebuild_registries_on_miss():
+        registry = get_modelforms_from_admin_sites()
+    return registry.get(model_name)
+
+
+def reset_caches() -> None:
+    """Clears the registries, e.g. after registering ModelAdmin
+    classes late. The registries are rebuilt on the next lookup and
+    may again be rebuilt once on a miss.
+    """
+    global _modeladmin_registry, _modelform_registry, _rebuilt_on_miss
+    _modeladmin_registry, _modelform_registry = None, None
+    _rebuilt_on_miss = False
 
 
 def get_form_runner_issues(
     model_name: str, related_visit: RelatedVisitModel, panel_name: str | None = None
 ) -> QuerySet[Issue] | None:
-    return get_issue_model_cls().objects.filter(
-        subject_identifier=related_visit.subject_identifier,
-        label_lower=model_name,
-        visit_code=related_visit.visit_code,
-        visit_code_sequence=related_visit.visit_code_sequence,
-        visit_schedule_name=related_visit.visit_schedule_name,
-        schedule_name=related_visit.schedule_name,
-        panel_name=panel_name,
+    return (
+        get_issue_model_cls()
+        .objects.filter(
+            subject_identifier=related_visit.subject_identifier,
+            label_lower=model_name,
+            visit_code=related_visit.visit_code,
+            visit_code_sequence=related_visit.visit_code_sequence,
+            visit_schedule_name=related_visit.visit_schedule_name,
+            schedule_name=related_visit.schedule_name,
+            panel_name=panel_name,
+        )
+        .only("message", "field_name")
     )
 
 
-# @cache
-# def get_modelforms_from_admin_sites() -> dict[str, Type[ModelForm]]:
-#     registry = {}
-#     for admin_site in admin.sites.all_sites:
-#         registry.update(**get_modelforms_from_admin_site(admin_site))
-#     return registry
+def get_form_runner_issues_key(
+    model_name: str, related_visit: RelatedVisitModel, panel_name: str | None = None
+) -> tuple:
+    """Returns the key used to look up issues in the dictionary
+    returned by `bulk_get_form_runner_issues`.
+    """
+    return (
+        model_name,
+        related_visit.subject_identifier,
+        related_visit.visit_code,
+        related_visit.visit_code_sequence,
+        related_visit.visit_schedule_name,
+        related_visit.schedule_name,
+        panel_name,
+    )
+
 
-# def get_modelform_cls(model_name: str) -> Type[ModelForm]:
-#     return get_modelforms_from_admin_sites().get(model_name)
+def bulk_get_form_runner_issues(
+    model_names: list[str], related_visits: list[RelatedVisitModel]
+) -> dict[tuple, list[tuple[str, str]]]:
+    """Returns a dictionary of (message, field_name) tuples for the
+    given models and visits using a single query.
+
+    Use `get_form_runner_issues_key` to look up the issues for a
+    model / visit / panel.
+    """
+    issues = {}
+    qs = (
+        get_issue_model_cls()
+        .objects.filter(
+            label_lower__in=model_names,
+            subject_identifier__in={obj.subject_identifier for obj in related_visits},
+            visit_code__in={obj.visit_code for obj in related_visits},
+        )
+        .values_list(
+            "label_lower",
+            "subject_identifier",
+            "visit_code",
+            "visit_code_sequence",
+            "visit_schedule_name",
+            "schedule_name",
+            "panel_name",
+            "message",
+            "field_name",
+        )
+    )
+    for row in qs:
+        issues.setdefault(row[:7], []).append(row[7:])
+    return issues